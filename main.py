@@ -10,6 +10,8 @@ This script orchestrates the entire RSS digest generation process:
 5. Create daily Markdown report
 6. Update README with latest digest
 """
+import asyncio
+import io
 import logging
 import sys
 from datetime import datetime
@@ -20,12 +22,12 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent / ".env")
 
 from src.config import get_config
-from src.opml_parser import parse_opml, get_categories
+from src.opml_parser import parse_opml_cached, get_categories
 from src.feed_fetcher import fetch_recent_articles
 from src.llm_client import get_llm_client
-from src.summarizer import summarize_articles, SummarySource
+from src.summarizer import iter_summaries, SummarySource
 from src.report_generator import (
-    generate_daily_report,
+    generate_daily_report_streaming,
     generate_empty_report,
     save_report,
     update_readme,
@@ -68,7 +70,7 @@ def main() -> int:
     # Step 2: Parse OPML
     logger.info("Step 2: Parsing OPML subscriptions...")
     try:
-        feeds = parse_opml(config.opml_path)
+        feeds = parse_opml_cached(config.opml_path)
         categories = get_categories(feeds)
         logger.info(f"  Found {len(feeds)} feeds in {len(categories)} categories")
     except Exception as e:
@@ -96,25 +98,26 @@ def main() -> int:
         logger.error(f"Failed to initialize LLM client: {e}")
         return 1
     
-    # Step 5: Generate summaries
+    # Steps 5+6: Generate summaries, streaming them into the report
     logger.info("Step 5: Generating AI summaries...")
-    summaries = summarize_articles(articles, llm)
-    
+    logger.info("Step 6: Generating daily report (streamed)...")
+    today = datetime.now()
+    report_buffer = io.StringIO()
+    summaries = asyncio.run(
+        generate_daily_report_streaming(iter_summaries(articles, llm), report_buffer, today)
+    )
+    report_content = report_buffer.getvalue()
+
     # Log statistics
     source_stats = {source: 0 for source in SummarySource}
     for summary in summaries:
         source_stats[summary.source] += 1
-    
+
     logger.info("  Summary statistics:")
     logger.info(f"    LLM Direct: {source_stats[SummarySource.LLM_DIRECT]}")
     logger.info(f"    Jina Reader: {source_stats[SummarySource.JINA_READER]}")
     logger.info(f"    RSS Fallback: {source_stats[SummarySource.RSS_FALLBACK]}")
-    
-    # Step 6: Generate report
-    logger.info("Step 6: Generating daily report...")
-    today = datetime.now()
-    report_content = generate_daily_report(summaries, today)
-    
+
     # Step 7: Save report
     logger.info("Step 7: Saving report...")
     report_path = save_report(report_content, today)
@@ -23,8 +23,7 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 from src.lark_sync import LarkClient, sync_summaries_to_lark
-from src.summarizer import ArticleSummary, SummarySource
-from src.feed_fetcher import Article
+from src.summarizer import ArticleMeta, ArticleSummary, SummarySource
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,6 +32,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Extract date from filename (e.g., 2026-02-03.md)
+FILE_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+# Single pattern matching both category headers and article sections so
+# the whole digest is parsed in one pass, in document order:
+# ## Category
+# ### [Title](URL)
+# > 来源: Feed | 发布时间: YYYY-MM-DD HH:MM
+#
+# Summary content...
+DIGEST_RE = re.compile(
+    r'^## (?P<category>[^\n]+)$'
+    r'|### \[(?P<title>.+?)\]\((?P<url>.+?)\)\s*\n'
+    r'> 来源: (?P<feed>.+?) \| 发布时间: (?P<pub>\d{4}-\d{2}-\d{2} \d{2}:\d{2})\s*\n'
+    r'\n'
+    r'(?P<summary>.*?)(?=\n---|\Z)',
+    re.MULTILINE | re.DOTALL
+)
+
 
 def parse_digest_file(filepath: Path) -> list[ArticleSummary]:
     """
@@ -47,70 +65,48 @@ def parse_digest_file(filepath: Path) -> list[ArticleSummary]:
     content = filepath.read_text(encoding="utf-8")
     summaries: list[ArticleSummary] = []
     
-    # Extract date from filename (e.g., 2026-02-03.md)
-    date_match = re.search(r"(\d{4}-\d{2}-\d{2})", filepath.name)
+    date_match = FILE_DATE_RE.search(filepath.name)
     file_date = date_match.group(1) if date_match else datetime.now().strftime("%Y-%m-%d")
-    
-    # Pattern to match article sections
-    # ### [Title](URL)
-    # > 来源: Feed | 发布时间: YYYY-MM-DD HH:MM
-    # 
-    # Summary content...
-    article_pattern = re.compile(
-        r'### \[(.+?)\]\((.+?)\)\s*\n'
-        r'> 来源: (.+?) \| 发布时间: (\d{4}-\d{2}-\d{2} \d{2}:\d{2})\s*\n'
-        r'\n'
-        r'(.*?)(?=\n---|\Z)',
-        re.DOTALL
-    )
-    
-    # Get current category (## Category)
+
+    # Walk the document once, tracking the most recent category header
     current_category = "Uncategorized"
-    
-    # Split by category headers
-    category_pattern = re.compile(r'^## (.+)$', re.MULTILINE)
-    categories = category_pattern.split(content)
-    
-    # Process each category section
-    for i in range(1, len(categories), 2):
-        if i + 1 < len(categories):
-            current_category = categories[i].strip()
-            section_content = categories[i + 1]
-            
-            # Find all articles in this section
-            for match in article_pattern.finditer(section_content):
-                title = match.group(1).strip()
-                url = match.group(2).strip()
-                feed_title = match.group(3).strip()
-                pub_time_str = match.group(4).strip()
-                summary_text = match.group(5).strip()
-                
-                # Parse publication time
-                try:
-                    published = datetime.strptime(pub_time_str, "%Y-%m-%d %H:%M")
-                except ValueError:
-                    published = datetime.strptime(f"{file_date} 00:00", "%Y-%m-%d %H:%M")
-                
-                # Determine summary source from content statistics in header
-                # Default to JINA_READER as most common
-                source = SummarySource.JINA_READER
-                
-                article = Article(
-                    title=title,
-                    url=url,
-                    published=published,
-                    summary="",  # Original RSS summary not available
-                    feed_title=feed_title,
-                    category=current_category,
-                )
-                
-                article_summary = ArticleSummary(
-                    article=article,
-                    summary=summary_text,
-                    source=source,
-                )
-                summaries.append(article_summary)
-    
+
+    for match in DIGEST_RE.finditer(content):
+        if match.group("category"):
+            current_category = match.group("category").strip()
+            continue
+
+        title = match.group("title").strip()
+        url = match.group("url").strip()
+        feed_title = match.group("feed").strip()
+        pub_time_str = match.group("pub").strip()
+        summary_text = match.group("summary").strip()
+
+        # Parse publication time
+        try:
+            published = datetime.strptime(pub_time_str, "%Y-%m-%d %H:%M")
+        except ValueError:
+            published = datetime.strptime(f"{file_date} 00:00", "%Y-%m-%d %H:%M")
+
+        # Determine summary source from content statistics in header
+        # Default to JINA_READER as most common
+        source = SummarySource.JINA_READER
+
+        meta = ArticleMeta(
+            title=title,
+            url=url,
+            category=current_category,
+            published=published,
+            feed_title=feed_title,
+        )
+
+        article_summary = ArticleSummary(
+            meta=meta,
+            summary=summary_text,
+            source=source,
+        )
+        summaries.append(article_summary)
+
     return summaries
 
 
@@ -154,6 +150,7 @@ def sync_all_archives(
                     app_token=app_token,
                     table_id=table_id,
                     skip_existing=True,
+                    full_scan=True,
                 )
                 total_synced += synced
                 total_skipped += skipped
@@ -3,11 +3,12 @@ Configuration management for Auto-RSS-Digest.
 Loads all settings from environment variables.
 """
 import os
+import threading
 from dataclasses import dataclass
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """Application configuration loaded from environment variables."""
     
@@ -23,6 +24,12 @@ class Config:
     # Content Settings
     max_content_length: int = 15000
     api_delay_seconds: float = 2.0
+    fetch_concurrency: int = 16
+    llm_concurrency: int = 4
+    provider_rpm: int = 0   # 0 = derive from api_delay_seconds
+    provider_tpm: int = 0   # 0 = no token budget
+    summary_cache_enabled: bool = True
+    speculative_summary: bool = False
     
     # Paths
     opml_path: str = "feeds.opml"
@@ -46,6 +53,12 @@ class Config:
             time_window_hours=int(os.getenv("TIME_WINDOW_HOURS", "24")),
             max_content_length=int(os.getenv("MAX_CONTENT_LENGTH", "15000")),
             api_delay_seconds=float(os.getenv("API_DELAY_SECONDS", "2.0")),
+            fetch_concurrency=int(os.getenv("FETCH_CONCURRENCY", "16")),
+            llm_concurrency=int(os.getenv("LLM_CONCURRENCY", "4")),
+            provider_rpm=int(os.getenv("PROVIDER_RPM", "0")),
+            provider_tpm=int(os.getenv("PROVIDER_TPM", "0")),
+            summary_cache_enabled=os.getenv("SUMMARY_CACHE", "1") != "0",
+            speculative_summary=os.getenv("SPECULATIVE_SUMMARY", "0") == "1",
             opml_path=os.getenv("OPML_PATH", "feeds.opml"),
             archives_dir=os.getenv("ARCHIVES_DIR", "archives"),
             readme_path=os.getenv("README_PATH", "README.md"),
@@ -67,23 +80,39 @@ class Config:
         
         if self.time_window_hours < 1:
             errors.append("TIME_WINDOW_HOURS must be at least 1")
+
+        if self.fetch_concurrency < 1:
+            errors.append("FETCH_CONCURRENCY must be at least 1")
+
+        if self.llm_concurrency < 1:
+            errors.append("LLM_CONCURRENCY must be at least 1")
+
+        if self.provider_rpm < 0:
+            errors.append("PROVIDER_RPM must not be negative")
+
+        if self.provider_tpm < 0:
+            errors.append("PROVIDER_TPM must not be negative")
         
         return errors
 
 
 # Global config instance
 _config: Config | None = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
-    """Get the global configuration instance."""
+    """Get the global configuration instance (thread-safe)."""
     global _config
     if _config is None:
-        _config = Config.from_env()
+        with _config_lock:
+            if _config is None:
+                _config = Config.from_env()
     return _config
 
 
 def reset_config() -> None:
     """Reset the global configuration (useful for testing)."""
     global _config
-    _config = None
+    with _config_lock:
+        _config = None
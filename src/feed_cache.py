@@ -0,0 +1,73 @@
+"""
+Feed Cache - Persist ETag/Last-Modified headers for conditional GET.
+
+Most feeds don't change between runs; sending If-None-Match /
+If-Modified-Since lets the server answer 304 with no body, skipping
+both the download and the parse for unchanged feeds.
+"""
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = ".feed_cache.json"
+
+
+class FeedCache:
+    """On-disk cache of HTTP validators per feed URL."""
+
+    def __init__(self, path: str | Path):
+        """
+        Initialize the cache, loading existing entries if present.
+
+        Args:
+            path: Path to the cache JSON file
+        """
+        self.path = Path(path)
+        self._entries: dict[str, dict[str, str]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Load cached validators from disk, ignoring corrupt files."""
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                self._entries = data
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable feed cache {self.path}: {e}")
+            self._entries = {}
+
+    def conditional_headers(self, xml_url: str) -> dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a feed URL."""
+        entry = self._entries.get(xml_url, {})
+        headers: dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("modified"):
+            headers["If-Modified-Since"] = entry["modified"]
+        return headers
+
+    def update(self, xml_url: str, etag: str | None, modified: str | None) -> None:
+        """Record the validators returned by the latest successful fetch."""
+        if not etag and not modified:
+            return
+        entry: dict[str, str] = {}
+        if etag:
+            entry["etag"] = etag
+        if modified:
+            entry["modified"] = modified
+        self._entries[xml_url] = entry
+
+    def save(self) -> None:
+        """Persist the cache to disk."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps(self._entries, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            logger.warning(f"Failed to save feed cache {self.path}: {e}")
@@ -1,20 +1,42 @@
 """
 Feed Fetcher - Fetch RSS feeds and filter articles by time.
 """
+import asyncio
 import logging
+import re
+from calendar import timegm
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from pathlib import Path
 from typing import Optional
 
 import feedparser
-from dateutil import parser as date_parser
+import httpx
+from lxml import etree
+from lxml import html as lxml_html
 
+from .config import get_config
+from .feed_cache import CACHE_FILENAME, FeedCache
 from .opml_parser import Feed
 
 logger = logging.getLogger(__name__)
 
+# Timeout for a single feed download
+FETCH_TIMEOUT = 20.0
 
-@dataclass
+# Bodies above this size go through the lxml streaming parser instead of
+# feedparser's full in-memory entry build
+STREAMING_THRESHOLD = 256 * 1024
+
+# Pre-compiled patterns for summary cleaning (regex path is the fallback
+# for markup that lxml refuses to parse)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+
+@dataclass(slots=True)
 class Article:
     """Represents a single article from an RSS feed."""
     title: str
@@ -28,68 +50,149 @@ class Article:
         return f"Article({self.title!r}, feed={self.feed_title!r})"
 
 
-def fetch_feed(feed: Feed) -> list[Article]:
+def fetch_feed(feed: Feed, min_published: Optional[datetime] = None) -> list[Article]:
     """
-    Fetch articles from a single RSS feed.
-    
+    Fetch articles from a single RSS feed (blocking).
+
     Args:
         feed: Feed object containing the RSS URL
-        
+        min_published: Discard entries older than this before building them
+
     Returns:
         List of Article objects
     """
     try:
         parsed = feedparser.parse(feed.xml_url)
-        
-        if parsed.bozo and parsed.bozo_exception:
-            logger.warning(f"Feed parse warning for {feed.title}: {parsed.bozo_exception}")
-        
-        articles: list[Article] = []
-        
-        for entry in parsed.entries:
-            article = _parse_entry(entry, feed)
-            if article:
-                articles.append(article)
-        
-        return articles
-        
+        return _articles_from_parsed(parsed, feed, min_published)
+    except Exception as e:
+        logger.error(f"Failed to fetch feed {feed.title}: {e}")
+        return []
+
+
+async def _fetch_feed_async(
+    client: httpx.AsyncClient,
+    feed: Feed,
+    cache: Optional[FeedCache] = None,
+    cutoff: Optional[datetime] = None,
+) -> list[Article]:
+    """Download a single feed over the shared client and parse its body."""
+    try:
+        headers = cache.conditional_headers(feed.xml_url) if cache else {}
+        response = await client.get(feed.xml_url, headers=headers)
+
+        if response.status_code == 304:
+            logger.info(f"{feed.title}: not modified (304), skipping")
+            return []
+
+        response.raise_for_status()
+
+        if cache:
+            cache.update(
+                feed.xml_url,
+                etag=response.headers.get("ETag"),
+                modified=response.headers.get("Last-Modified"),
+            )
+
+        body = response.content
+
+        # Large feeds: stream-parse and stop at the cutoff instead of
+        # letting feedparser build every entry in memory
+        if len(body) > STREAMING_THRESHOLD:
+            articles = _parse_feed_streaming(body, feed, cutoff)
+            if articles is not None:
+                return articles
+
+        parsed = feedparser.parse(body)
+        return _articles_from_parsed(parsed, feed, cutoff)
     except Exception as e:
         logger.error(f"Failed to fetch feed {feed.title}: {e}")
         return []
 
 
-def _parse_entry(entry: dict, feed: Feed) -> Optional[Article]:
-    """Parse a single feed entry into an Article."""
+def _articles_from_parsed(
+    parsed: feedparser.FeedParserDict,
+    feed: Feed,
+    min_published: Optional[datetime] = None,
+) -> list[Article]:
+    """Convert a feedparser result into Article objects."""
+    if parsed.bozo and parsed.bozo_exception:
+        logger.warning(f"Feed parse warning for {feed.title}: {parsed.bozo_exception}")
+
+    articles: list[Article] = []
+
+    for entry in parsed.entries:
+        article = _parse_entry(entry, feed, min_published)
+        if article:
+            articles.append(article)
+
+    return articles
+
+
+def _build_article(
+    title: str,
+    url: str,
+    published: Optional[datetime],
+    summary: str,
+    feed: Feed,
+    min_published: Optional[datetime] = None,
+) -> Optional[Article]:
+    """Apply date sanity checks and summary cleaning, then build an Article."""
+    if not url:
+        return None
+
+    # Skip articles without valid publication date
+    # This prevents old articles from being treated as new
+    if published is None:
+        return None
+
+    # Outside the time window: bail before the HTML strip and the
+    # Article allocation — most entries in a feed die here
+    if min_published is not None and published < min_published:
+        return None
+
+    # Sanity check: skip articles with unreasonable dates
+    now = datetime.now(timezone.utc)
+    one_year_ago = now - timedelta(days=365)
+
+    # Skip if date is in the future (bad data)
+    if published > now + timedelta(hours=24):
+        logger.debug(f"Skipping article with future date: {title}")
+        return None
+
+    # Skip if date is too old (likely missing/default date)
+    if published < one_year_ago:
+        logger.debug(f"Skipping article with very old date: {title}")
+        return None
+
+    # Clean HTML from summary (basic cleaning)
+    summary = _strip_html(summary)[:500]  # Limit summary length
+
+    return Article(
+        title=title,
+        url=url,
+        published=published,
+        summary=summary,
+        feed_title=feed.title,
+        category=feed.category,
+    )
+
+
+def _parse_entry(
+    entry: dict,
+    feed: Feed,
+    min_published: Optional[datetime] = None,
+) -> Optional[Article]:
+    """Parse a single feedparser entry into an Article."""
     try:
-        # Get article URL
         url = entry.get("link", "")
-        if not url:
-            return None
-        
-        # Get title
         title = entry.get("title", "Untitled")
-        
-        # Parse publication date - SKIP articles without valid dates
         published = _parse_date(entry)
-        if published is None:
-            # Skip articles without valid publication date
-            # This prevents old articles from being treated as new
-            return None
-        
-        # Sanity check: skip articles with unreasonable dates
-        now = datetime.now(timezone.utc)
-        one_year_ago = now - timedelta(days=365)
-        
-        # Skip if date is in the future (bad data)
-        if published > now + timedelta(hours=24):
-            logger.debug(f"Skipping article with future date: {title}")
-            return None
-        
-        # Skip if date is too old (likely missing/default date)
-        if published < one_year_ago:
-            logger.debug(f"Skipping article with very old date: {title}")
+
+        # Check the window before touching the summary so out-of-window
+        # entries never pay for extraction/cleaning
+        if published is not None and min_published is not None and published < min_published:
             return None
-        
+
         # Get summary (RSS native description)
         summary = ""
         if "summary" in entry:
@@ -98,19 +201,9 @@ def _parse_entry(entry: dict, feed: Feed) -> Optional[Article]:
             summary = entry.description
         elif "content" in entry and entry.content:
             summary = entry.content[0].get("value", "")
-        
-        # Clean HTML from summary (basic cleaning)
-        summary = _strip_html(summary)[:500]  # Limit summary length
-        
-        return Article(
-            title=title,
-            url=url,
-            published=published,
-            summary=summary,
-            feed_title=feed.title,
-            category=feed.category,
-        )
-        
+
+        return _build_article(title, url, published, summary, feed, min_published)
+
     except Exception as e:
         logger.warning(f"Failed to parse entry from {feed.title}: {e}")
         return None
@@ -118,71 +211,205 @@ def _parse_entry(entry: dict, feed: Feed) -> Optional[Article]:
 
 def _parse_date(entry: dict) -> Optional[datetime]:
     """Parse publication date from feed entry."""
-    # Try different date fields
+    # Try different date fields. feedparser always produces a *_parsed
+    # struct_time (already UTC) when the date is valid, so there is no
+    # string-parsing fallback: timegm converts the tuple directly
+    # without the local-time round-trip mktime would take.
     for field in ["published", "updated", "created"]:
-        if field in entry:
+        parsed = entry.get(f"{field}_parsed")
+        if parsed:
             try:
-                # feedparser provides parsed time tuple
-                if f"{field}_parsed" in entry and entry[f"{field}_parsed"]:
-                    from time import mktime
-                    return datetime.fromtimestamp(
-                        mktime(entry[f"{field}_parsed"]), 
-                        tz=timezone.utc
-                    )
-                # Fallback to string parsing
-                return date_parser.parse(entry[field])
-            except (ValueError, TypeError):
+                return datetime.fromtimestamp(timegm(parsed), tz=timezone.utc)
+            except (ValueError, TypeError, OverflowError):
                 continue
     return None
 
 
+def _parse_date_text(text: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date string to UTC."""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        dt = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _parse_feed_streaming(
+    body: bytes,
+    feed: Feed,
+    cutoff: Optional[datetime] = None,
+) -> Optional[list[Article]]:
+    """
+    Parse feed XML incrementally with lxml, stopping early at the cutoff.
+
+    Large feeds carry hundreds of entries but only the first few fall
+    inside the time window; streaming avoids materializing the rest.
+    Entries are assumed near-chronological, so parsing stops at the
+    first entry older than `cutoff`.
+
+    Args:
+        body: Raw feed XML bytes
+        feed: Feed the body belongs to
+        cutoff: Stop parsing once an entry is older than this
+
+    Returns:
+        List of Article objects, or None if the XML is malformed
+        (caller should fall back to feedparser)
+    """
+    articles: list[Article] = []
+
+    try:
+        for _, elem in etree.iterparse(BytesIO(body), events=("end",)):
+            if not isinstance(elem.tag, str):
+                continue
+            localname = etree.QName(elem).localname
+            if localname not in ("entry", "item"):
+                continue
+
+            title = "Untitled"
+            url = ""
+            summary = ""
+            published: Optional[datetime] = None
+            updated: Optional[datetime] = None
+
+            for child in elem:
+                if not isinstance(child.tag, str):
+                    continue
+                name = etree.QName(child).localname
+                if name == "title" and child.text:
+                    title = child.text.strip()
+                elif name == "link":
+                    href = child.get("href")
+                    if href:
+                        # Atom: prefer rel="alternate" (or unqualified) links
+                        if not url or child.get("rel") in (None, "alternate"):
+                            url = href
+                    elif child.text and not url:
+                        url = child.text.strip()
+                elif name in ("pubDate", "published"):
+                    published = _parse_date_text(child.text)
+                elif name in ("updated", "date"):
+                    updated = _parse_date_text(child.text)
+                elif name in ("summary", "description") and child.text:
+                    summary = child.text
+                elif name in ("encoded", "content") and not summary and child.text:
+                    summary = child.text
+
+            published = published or updated
+
+            # Early exit: the remaining entries are older than the window
+            if cutoff and published and published < cutoff:
+                break
+
+            article = _build_article(title, url, published, summary, feed, cutoff)
+            if article:
+                articles.append(article)
+
+            # Release the subtree so memory stays flat on huge feeds
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    except etree.XMLSyntaxError as e:
+        logger.debug(f"Streaming parse failed for {feed.title}, falling back: {e}")
+        return None
+
+    return articles
+
+
 def _strip_html(text: str) -> str:
-    """Remove HTML tags from text (basic implementation)."""
-    import re
-    # Remove HTML tags
-    clean = re.sub(r"<[^>]+>", "", text)
-    # Normalize whitespace
-    clean = re.sub(r"\s+", " ", clean)
-    return clean.strip()
+    """Remove HTML tags from text and decode entities."""
+    if not text:
+        return ""
+    try:
+        # lxml tokenizes in C and decodes entities like &amp; in one pass
+        stripped = lxml_html.fromstring(text).text_content()
+    except Exception:
+        # Malformed/empty markup: fall back to plain tag stripping
+        stripped = _TAG_RE.sub("", text)
+    return _WS_RE.sub(" ", stripped).strip()
 
 
-def fetch_recent_articles(
-    feeds: list[Feed], 
+async def fetch_recent_articles_async(
+    feeds: list[Feed],
     hours: int = 24,
-    reference_time: Optional[datetime] = None
+    reference_time: Optional[datetime] = None,
+    max_connections: Optional[int] = None,
 ) -> list[Article]:
     """
-    Fetch articles from multiple feeds, filtering by time.
-    
+    Fetch articles from multiple feeds concurrently, filtering by time.
+
+    All feeds are downloaded over a single pooled AsyncClient so TCP/TLS
+    connections are reused across feeds on the same host, and one event
+    loop drives every download instead of one thread per feed.
+
     Args:
         feeds: List of Feed objects to fetch
         hours: Time window in hours (default: 24)
         reference_time: Reference time for filtering (default: now)
-        
+        max_connections: Connection pool size (default: from config)
+
     Returns:
         List of Article objects published within the time window
     """
     if reference_time is None:
         reference_time = datetime.now(timezone.utc)
-    
+
+    if max_connections is None:
+        max_connections = get_config().fetch_concurrency
+
     cutoff_time = reference_time - timedelta(hours=hours)
-    
+
     all_articles: list[Article] = []
-    
-    for feed in feeds:
-        logger.info(f"Fetching: {feed.title}")
-        articles = fetch_feed(feed)
-        
+
+    if not feeds:
+        return all_articles
+
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    headers = {"User-Agent": feedparser.USER_AGENT}
+    cache = FeedCache(Path(get_config().archives_dir) / CACHE_FILENAME)
+
+    async with httpx.AsyncClient(
+        timeout=FETCH_TIMEOUT,
+        limits=limits,
+        headers=headers,
+        follow_redirects=True,
+    ) as client:
+        tasks = [_fetch_feed_async(client, feed, cache, cutoff_time) for feed in feeds]
+        results = await asyncio.gather(*tasks)
+
+    cache.save()
+
+    for feed, articles in zip(feeds, results):
         # Filter by time
         recent = [
             article for article in articles
             if article.published >= cutoff_time
         ]
-        
-        logger.info(f"  Found {len(recent)}/{len(articles)} recent articles")
+
+        logger.info(f"{feed.title}: {len(recent)}/{len(articles)} recent articles")
         all_articles.extend(recent)
-    
+
     # Sort by publication time (newest first)
     all_articles.sort(key=lambda a: a.published, reverse=True)
-    
+
     return all_articles
+
+
+def fetch_recent_articles(
+    feeds: list[Feed],
+    hours: int = 24,
+    reference_time: Optional[datetime] = None,
+) -> list[Article]:
+    """Synchronous wrapper around fetch_recent_articles_async for main.py."""
+    return asyncio.run(
+        fetch_recent_articles_async(feeds, hours=hours, reference_time=reference_time)
+    )
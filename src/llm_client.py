@@ -3,13 +3,34 @@ LLM Client - Unified interface for Gemini and DeepSeek models.
 Supports English thinking with Chinese output.
 """
 import logging
+import re
 from abc import ABC, abstractmethod
+from functools import cache
 from typing import Optional
 
+import httpx
+import orjson
+
 from .config import get_config
+from .tls import shared_ssl_context
 
 logger = logging.getLogger(__name__)
 
+
+# SDK imports cost 150-300ms each (protobuf/grpc for Gemini, pydantic
+# for OpenAI); memoized helpers defer them to first actual use
+@cache
+def _get_genai():
+    import google.generativeai as genai
+    return genai
+
+
+@cache
+def _get_openai():
+    from openai import OpenAI
+    return OpenAI
+
+
 # System prompt for English thinking, Chinese output
 SYSTEM_PROMPT = """You are a professional information analyst.
 IMPORTANT: You MUST think and reason in English internally,
@@ -17,12 +38,10 @@ but your final output MUST be in Simplified Chinese.
 
 Your task is to analyze articles and provide concise, insightful summaries."""
 
-USER_PROMPT_TEMPLATE = """Article Category: {category}
-Article URL: {url}
-Article Content:
-{content}
-
-Please analyze this article and provide:
+# Static instruction block shared by all per-article prompts. It is
+# sent first so providers with prompt-prefix caching (e.g. DeepSeek)
+# match it across calls; only the article payload after it varies.
+PROMPT_INSTRUCTIONS = """Please analyze the article you are given and provide:
 1. One-sentence core insight (核心观点)
 2. Three key takeaways as bullet points (关键要点)
 
@@ -37,29 +56,135 @@ Format your response EXACTLY as:
 Remember: Think in English, output in Chinese."""
 
 
+def _build_content_prompt(url: str, content: str, category: str, limit: int) -> str:
+    """Build the prompt for summarizing fetched article content."""
+    return (
+        f"{PROMPT_INSTRUCTIONS}\n\n"
+        f"Article Category: {category}\n"
+        f"Article URL: {url}\n"
+        f"Article Content:\n{content[:limit]}"
+    )
+
+
+def _build_url_prompt(url: str, category: str) -> str:
+    """Build the prompt for summarizing directly from a URL."""
+    return (
+        f"{PROMPT_INSTRUCTIONS}\n\n"
+        f"Article Category: {category}\n"
+        f"Please read and analyze the article at this URL: {url}"
+    )
+
+BATCH_PROMPT_TEMPLATE = """You will be given {count} articles. Analyze EACH one independently.
+
+{articles}
+
+For EACH article, in the same order, provide:
+1. One-sentence core insight (核心观点)
+2. Three key takeaways (关键要点)
+
+Respond with a JSON object shaped EXACTLY as:
+{{"summaries": [{{"insight": "<core insight in Chinese>", "takeaways": ["<point 1 in Chinese>", "<point 2 in Chinese>", "<point 3 in Chinese>"]}}, ...]}}
+
+The "summaries" array must contain exactly {count} objects, one per article, in input order.
+Output ONLY the JSON object.
+
+Remember: Think in English, output in Chinese."""
+
+# Splits legacy delimiter-formatted batch responses (non-JSON fallback)
+_BATCH_SPLIT_RE = re.compile(r"^\s*={3,}\s*$", re.MULTILINE)
+
+# Strips a markdown code fence around a JSON response
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+# Last-resort splitter: one block per **核心观点** heading. Lazy match
+# up to the next heading (or end) keeps matching linear — no nested
+# quantifiers to backtrack on pathological LLM output.
+_SUMMARY_BLOCK_RE = re.compile(
+    r"\*\*核心观点\*\*:.*?(?=\n\*\*核心观点\*\*:|\Z)",
+    re.DOTALL,
+)
+
+
+def _render_summary(item: dict) -> str:
+    """Render one structured summary object into the digest format."""
+    insight = str(item.get("insight", "")).strip()
+    takeaways = item.get("takeaways") or []
+    bullets = "\n".join(f"- {str(point).strip()}" for point in takeaways)
+    return f"**核心观点**: {insight}\n\n**关键要点**:\n{bullets}"
+
+
+def _parse_batch_response(response: str, count: int) -> list[str]:
+    """
+    Parse a batched response into one formatted summary per article.
+
+    Tries strict JSON first (accepting either the documented
+    {"summaries": [...]} shape or a bare array, with or without a code
+    fence), then falls back to splitting on `=====` delimiter lines, and
+    finally to cutting the text at each **核心观点** heading — for models
+    that ignore the JSON instruction entirely.
+
+    Raises:
+        ValueError: If no parse yields exactly `count` summaries
+    """
+    text = response.strip()
+    fence = _JSON_FENCE_RE.search(text)
+    if fence:
+        text = fence.group(1)
+
+    try:
+        data = orjson.loads(text)
+        if isinstance(data, dict):
+            data = data.get("summaries")
+        if isinstance(data, list) and len(data) == count:
+            return [_render_summary(item) for item in data]
+    except ValueError:
+        pass
+
+    # Fallback: delimiter-separated pre-formatted summaries
+    parts = [part.strip() for part in _BATCH_SPLIT_RE.split(response) if part.strip()]
+    if len(parts) == count:
+        return parts
+
+    # Last resort: split at the formatted summary headings themselves
+    blocks = [block.strip() for block in _SUMMARY_BLOCK_RE.findall(response)]
+    if len(blocks) == count:
+        return blocks
+
+    raise ValueError(f"Batched response did not yield {count} summaries")
+
+
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
-    
-    @abstractmethod
+
+    def __init__(self):
+        # Read once per client instead of on every summarize call
+        self._max_content_length = get_config().max_content_length
+
     def summarize(
-        self, 
-        url: str, 
-        content: str, 
+        self,
+        url: str,
+        content: str,
         category: str
     ) -> str:
         """
         Generate a summary for an article.
-        
+
         Args:
             url: Article URL
             content: Article content (may be empty for URL-based summarization)
             category: Article category for context
-            
+
         Returns:
             Formatted summary in Chinese
         """
-        pass
-    
+        prompt = _build_content_prompt(url, content, category, self._max_content_length)
+
+        try:
+            return self._generate(prompt)
+        except Exception as e:
+            logger.error(f"{type(self).__name__} summarization failed: {e}")
+            raise
+
     @abstractmethod
     def summarize_from_url(self, url: str, category: str) -> Optional[str]:
         """
@@ -75,61 +200,118 @@ class LLMClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def _generate(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        json_mode: bool = False,
+    ) -> str:
+        """Send a single prompt to the model and return the raw text."""
+        pass
+
+    def summarize_batch(self, items: list[tuple[str, str, str]]) -> list[str]:
+        """
+        Summarize several articles in a single LLM request.
+
+        Packing K articles into one prompt amortizes the request RTT and
+        instruction tokens across the batch — a K-fold request reduction
+        under RPM-limited providers.
+
+        Args:
+            items: List of (url, content, category) tuples
+
+        Returns:
+            One formatted summary per item, in input order
+
+        Raises:
+            ValueError: If the response does not parse into one summary
+                per article (caller should fall back to per-article calls)
+        """
+        if not items:
+            return []
+        if len(items) == 1:
+            url, content, category = items[0]
+            return [self.summarize(url, content, category)]
+
+        # Split the context budget evenly across the batch
+        per_item_limit = max(1000, self._max_content_length // len(items))
+
+        # When the whole batch shares one category (the normal case once
+        # batches are grouped by category), state it once up front
+        # instead of repeating it per article
+        categories = {category for _, _, category in items}
+        shared_category = categories.pop() if len(categories) == 1 else None
+
+        sections = []
+        for i, (url, content, category) in enumerate(items, 1):
+            header = f"## Article {i}\n"
+            if shared_category is None:
+                header += f"Category: {category}\n"
+            sections.append(
+                f"{header}"
+                f"URL: {url}\n"
+                f"Content:\n{content[:per_item_limit]}"
+            )
+
+        articles_block = "\n\n".join(sections)
+        if shared_category is not None:
+            articles_block = f"All articles below are in category: {shared_category}\n\n{articles_block}"
+
+        prompt = BATCH_PROMPT_TEMPLATE.format(
+            count=len(items),
+            articles=articles_block,
+        )
+
+        # Give the response budget room for one summary per article
+        response = self._generate(prompt, max_tokens=512 * len(items), json_mode=True)
+
+        return _parse_batch_response(response, len(items))
+
 
 class GeminiClient(LLMClient):
     """Google Gemini LLM client."""
     
     def __init__(self, api_key: str):
-        import google.generativeai as genai
-        
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(
-            model_name="gemini-2.0-flash",
-            system_instruction=SYSTEM_PROMPT,
-        )
-        logger.info("Initialized Gemini client (gemini-2.0-flash)")
-    
-    def summarize(self, url: str, content: str, category: str) -> str:
-        """Generate summary from content."""
-        prompt = USER_PROMPT_TEMPLATE.format(
-            category=category,
-            url=url,
-            content=content[:get_config().max_content_length],
-        )
-        
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
-        except Exception as e:
-            logger.error(f"Gemini summarization failed: {e}")
-            raise
-    
+        super().__init__()
+        self._api_key = api_key
+        self._model = None
+
+    @property
+    def model(self):
+        """The GenerativeModel, built (and the SDK imported) on first use."""
+        if self._model is None:
+            genai = _get_genai()
+            genai.configure(api_key=self._api_key)
+            self._model = genai.GenerativeModel(
+                model_name="gemini-2.0-flash",
+                system_instruction=SYSTEM_PROMPT,
+            )
+            logger.info("Initialized Gemini client (gemini-2.0-flash)")
+        return self._model
+
+    def _generate(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        json_mode: bool = False,
+    ) -> str:
+        """Send a prompt to Gemini and return the raw text."""
+        kwargs = {}
+        if json_mode:
+            kwargs["generation_config"] = {"response_mime_type": "application/json"}
+        response = self.model.generate_content(prompt, **kwargs)
+        return response.text.strip()
+
     def summarize_from_url(self, url: str, category: str) -> Optional[str]:
         """
         Generate summary by letting Gemini read the URL directly.
         Gemini 2.0 Flash supports URL understanding.
         """
-        prompt = f"""Article Category: {category}
+        prompt = _build_url_prompt(url, category)
 
-Please read and analyze the article at this URL: {url}
-
-Then provide:
-1. One-sentence core insight (核心观点)
-2. Three key takeaways as bullet points (关键要点)
-
-Format your response EXACTLY as:
-**核心观点**: [your one-sentence insight in Chinese]
-
-**关键要点**:
-- [point 1 in Chinese]
-- [point 2 in Chinese]
-- [point 3 in Chinese]
-
-Remember: Think in English, output in Chinese."""
-        
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return self._generate(prompt)
         except Exception as e:
             logger.warning(f"Gemini URL summarization failed for {url}: {e}")
             return None
@@ -139,38 +321,52 @@ class DeepSeekClient(LLMClient):
     """DeepSeek LLM client using OpenAI-compatible API."""
     
     def __init__(self, api_key: str, model: str = "deepseek-chat"):
-        from openai import OpenAI
-        
-        self.client = OpenAI(
-            api_key=api_key,
-            base_url="https://api.deepseek.com/v1",
-        )
+        super().__init__()
+        self._api_key = api_key
+        self._client = None
         self.model = model
-        logger.info(f"Initialized DeepSeek client ({model})")
-    
-    def summarize(self, url: str, content: str, category: str) -> str:
-        """Generate summary from content."""
-        prompt = USER_PROMPT_TEMPLATE.format(
-            category=category,
-            url=url,
-            content=content[:get_config().max_content_length],
-        )
-        
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.7,
-                max_tokens=1000,
+
+    @property
+    def client(self):
+        """The OpenAI client, built (and the SDK imported) on first use."""
+        if self._client is None:
+            # Shared context keeps TLS session tickets so reconnects to
+            # api.deepseek.com resume instead of re-handshaking
+            try:
+                http_client = httpx.Client(verify=shared_ssl_context(), http2=True)
+            except ImportError:
+                http_client = httpx.Client(verify=shared_ssl_context())
+
+            self._client = _get_openai()(
+                api_key=self._api_key,
+                base_url="https://api.deepseek.com/v1",
+                http_client=http_client,
             )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"DeepSeek summarization failed: {e}")
-            raise
-    
+            logger.info(f"Initialized DeepSeek client ({self.model})")
+        return self._client
+
+    def _generate(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        json_mode: bool = False,
+    ) -> str:
+        """Send a prompt to DeepSeek and return the raw text."""
+        kwargs = {}
+        if json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.7,
+            max_tokens=max_tokens or 1000,
+            **kwargs,
+        )
+        return response.choices[0].message.content.strip()
+
     def summarize_from_url(self, url: str, category: str) -> Optional[str]:
         """DeepSeek doesn't support direct URL reading."""
         return None
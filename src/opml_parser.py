@@ -1,12 +1,21 @@
 """
 OPML Parser - Parse OPML files to extract RSS feeds and categories.
 """
+import logging
+import pickle
 from dataclasses import dataclass
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
 class Feed:
     """Represents a single RSS feed subscription."""
     title: str
@@ -35,19 +44,59 @@ def parse_opml(file_path: str | Path) -> list[Feed]:
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"OPML file not found: {path}")
-    
+
+    if etree is not None:
+        return _parse_opml_lxml(path)
+    return _parse_opml_et(path)
+
+
+def _parse_opml_lxml(path: Path) -> list[Feed]:
+    """
+    Parse OPML with lxml's C-backed iterparse.
+
+    Walks <outline> elements iteratively with a manual category stack
+    (push on start of a folder outline, pop on its end) instead of
+    recursing Python-side through the tree.
+    """
+    feeds: list[Feed] = []
+    stack: list[str] = []
+
+    for event, elem in etree.iterparse(str(path), events=("start", "end"), tag="outline"):
+        xml_url = elem.get("xmlUrl")
+        if event == "start":
+            if xml_url:
+                # Feed entry: category is the innermost enclosing folder
+                feeds.append(Feed(
+                    title=elem.get("text", elem.get("title", "Unknown")),
+                    xml_url=xml_url,
+                    html_url=elem.get("htmlUrl", ""),
+                    category=(stack[-1] if stack else "") or "Uncategorized",
+                ))
+            else:
+                # Category folder
+                stack.append(elem.get("text", elem.get("title", "")))
+        else:
+            if not xml_url and stack:
+                stack.pop()
+            elem.clear()
+
+    return feeds
+
+
+def _parse_opml_et(path: Path) -> list[Feed]:
+    """Fallback OPML parse using stdlib ElementTree recursion."""
     tree = ET.parse(path)
     root = tree.getroot()
-    
+
     feeds: list[Feed] = []
     body = root.find("body")
-    
+
     if body is None:
         return feeds
-    
+
     # Process all outline elements
     _process_outlines(body, "", feeds)
-    
+
     return feeds
 
 
@@ -58,38 +107,81 @@ def _process_outlines(
 ) -> None:
     """
     Recursively process outline elements to extract feeds.
-    
+
     Args:
         parent: Parent XML element
         category: Current category name (from parent outline)
-        feeds: List to append found feeds to
+        feeds: List to extend with found feeds
     """
+    # Accumulate sibling feed entries and extend in one batch; flush
+    # before descending into a folder to keep document order
+    batch: list[Feed] = []
+
     for outline in parent.findall("outline"):
         xml_url = outline.get("xmlUrl")
-        
+
         if xml_url:
             # This is a feed entry
-            feed = Feed(
+            batch.append(Feed(
                 title=outline.get("text", outline.get("title", "Unknown")),
                 xml_url=xml_url,
                 html_url=outline.get("htmlUrl", ""),
                 category=category or "Uncategorized",
-            )
-            feeds.append(feed)
+            ))
         else:
             # This is a category folder, process children
+            if batch:
+                feeds.extend(batch)
+                batch = []
             folder_name = outline.get("text", outline.get("title", ""))
             _process_outlines(outline, folder_name, feeds)
 
+    if batch:
+        feeds.extend(batch)
+
+
+def parse_opml_cached(file_path: str | Path) -> list[Feed]:
+    """
+    Parse an OPML file, reusing a cached result while the file is unchanged.
+
+    The parse result is pickled next to the OPML file, keyed by the
+    file's (mtime_ns, size); repeated runs against an untouched OPML
+    skip the XML parse and Feed construction entirely.
+
+    Args:
+        file_path: Path to the OPML file
+
+    Returns:
+        List of Feed objects
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"OPML file not found: {path}")
+
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cache_path = path.with_name(path.name + ".cache")
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, feeds = pickle.load(f)
+        if cached_key == key:
+            return feeds
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        pass
+
+    feeds = parse_opml(path)
+
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((key, feeds), f)
+    except OSError as e:
+        logger.warning(f"Failed to write OPML cache {cache_path}: {e}")
+
+    return feeds
+
 
 def get_categories(feeds: list[Feed]) -> list[str]:
     """Get unique categories from a list of feeds, preserving order."""
-    seen: set[str] = set()
-    categories: list[str] = []
-    
-    for feed in feeds:
-        if feed.category not in seen:
-            seen.add(feed.category)
-            categories.append(feed.category)
-    
-    return categories
+    # dict preserves insertion order; one pass, no parallel seen-set
+    return list(dict.fromkeys(feed.category for feed in feeds))
@@ -0,0 +1,75 @@
+"""
+Rate Limiter - Async token bucket for pacing API calls.
+
+Unlike a fixed sleep between calls, a token bucket only blocks when the
+budget is actually exhausted, so burst capacity is spent first and idle
+headroom is never wasted.
+"""
+import asyncio
+import time
+
+
+class AsyncLimiter:
+    """Token bucket allowing `rate` token acquisitions per `period` seconds."""
+
+    def __init__(self, rate: float, period: float = 60.0):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens replenished per period (and bucket capacity)
+            period: Replenishment window in seconds (default: 60)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.period = period
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until `tokens` tokens are available, then consume them."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate,
+                    self._tokens + (now - self._updated) * self.rate / self.period,
+                )
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait = (tokens - self._tokens) * self.period / self.rate
+
+            await asyncio.sleep(wait)
+
+
+class DualRateLimiter:
+    """
+    Paired request and token buckets for provider RPM/TPM budgets.
+
+    A call acquires one request token plus its estimated prompt tokens;
+    it only blocks when either budget is exhausted, so bursts run at
+    full speed until the provider's actual limits are approached.
+    Either dimension can be disabled by passing 0.
+    """
+
+    def __init__(self, rpm: float, tpm: float = 0.0):
+        """
+        Args:
+            rpm: Requests per minute budget (0 disables the bucket)
+            tpm: Tokens per minute budget (0 disables the bucket)
+        """
+        self._requests = AsyncLimiter(rpm) if rpm > 0 else None
+        self._tokens = AsyncLimiter(tpm) if tpm > 0 else None
+
+    async def acquire(self, tokens: float = 0.0) -> None:
+        """Consume one request plus `tokens` estimated prompt tokens."""
+        if self._requests is not None:
+            await self._requests.acquire()
+        if self._tokens is not None and tokens > 0:
+            await self._tokens.acquire(min(tokens, self._tokens.rate))
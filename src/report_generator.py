@@ -1,7 +1,9 @@
 """
 Report Generator - Generate Markdown daily digest reports.
 """
+import io
 import logging
+import os
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +15,95 @@ from .summarizer import ArticleSummary, SummarySource
 logger = logging.getLogger(__name__)
 
 
+# One template per article block; a single format call replaces the
+# per-line string assembly the old lines.append loop did
+_ARTICLE_TMPL = """### [{title}]({url})
+> 来源: {feed} | 发布时间: {pub:%Y-%m-%d %H:%M}
+
+{summary}
+
+---
+
+"""
+
+
+def _render_article(summary: ArticleSummary) -> str:
+    """Render one summarized article as a Markdown block."""
+    meta = summary.meta
+    return _ARTICLE_TMPL.format(
+        title=meta.title,
+        url=meta.url,
+        feed=meta.feed_title,
+        pub=meta.published,
+        summary=summary.summary,
+    )
+
+
+async def generate_daily_report_streaming(
+    summaries,
+    out,
+    date: Optional[datetime] = None,
+) -> list[ArticleSummary]:
+    """
+    Write a Markdown daily report from an async stream of summaries.
+
+    Each article block is rendered as soon as its summary completes, so
+    formatting overlaps the remaining LLM calls and no second full-report
+    string buffer is built. The header needs the final article and source
+    counts, so output is flushed to `out` once the stream is exhausted.
+
+    Args:
+        summaries: Async iterable of ArticleSummary objects
+        out: Writable text stream (file handle or StringIO)
+        date: Report date (default: today)
+
+    Returns:
+        The consumed ArticleSummary objects, in completion order
+    """
+    if date is None:
+        date = datetime.now()
+
+    date_str = f"{date:%Y-%m-%d}"
+
+    by_category: dict[str, list[str]] = defaultdict(list)
+    source_counts = {source: 0 for source in SummarySource}
+    collected: list[ArticleSummary] = []
+
+    async for summary in summaries:
+        collected.append(summary)
+        source_counts[summary.source] += 1
+        by_category[summary.meta.category].append(_render_article(summary))
+
+    _write_report(out, date_str, len(collected), source_counts, by_category)
+
+    return collected
+
+
+def _write_report(
+    out,
+    date_str: str,
+    total: int,
+    source_counts: dict[SummarySource, int],
+    by_category: dict[str, list[str]],
+) -> None:
+    """Write header, category sections and footer for rendered blocks."""
+    # Header
+    out.write(f"# RSS Digest - {date_str}\n\n")
+    out.write(f"> 本日共收录 **{total}** 篇文章，来自 **{len(by_category)}** 个分类。\n>\n")
+    out.write(f"> 📊 内容获取统计：LLM直读 {source_counts[SummarySource.LLM_DIRECT]} | "
+              f"Jina Reader {source_counts[SummarySource.JINA_READER]} | "
+              f"RSS降级 {source_counts[SummarySource.RSS_FALLBACK]}\n\n")
+    out.write("---\n\n")
+
+    # Content by category, one joined write per section
+    for category in sorted(by_category.keys()):
+        out.write(f"## {category}\n\n")
+        out.write("".join(by_category[category]))
+
+    # Footer
+    out.write(f"*Generated at {datetime.now():%Y-%m-%d %H:%M:%S} (SGT)*")
+
+
 def generate_daily_report(
     summaries: list[ArticleSummary],
     date: Optional[datetime] = None,
@@ -29,56 +120,19 @@ def generate_daily_report(
     """
     if date is None:
         date = datetime.now()
-    
-    date_str = date.strftime("%Y-%m-%d")
-    
-    # Group by category
-    by_category: dict[str, list[ArticleSummary]] = defaultdict(list)
-    for summary in summaries:
-        by_category[summary.article.category].append(summary)
-    
-    # Count sources
+
+    date_str = f"{date:%Y-%m-%d}"
+
+    # Group pre-rendered article blocks by category, counting sources
+    by_category: dict[str, list[str]] = defaultdict(list)
     source_counts = {source: 0 for source in SummarySource}
     for summary in summaries:
         source_counts[summary.source] += 1
-    
-    # Build report
-    lines: list[str] = []
-    
-    # Header
-    lines.append(f"# RSS Digest - {date_str}")
-    lines.append("")
-    lines.append(f"> 本日共收录 **{len(summaries)}** 篇文章，来自 **{len(by_category)}** 个分类。")
-    lines.append(">")
-    lines.append(f"> 📊 内容获取统计：LLM直读 {source_counts[SummarySource.LLM_DIRECT]} | "
-                 f"Jina Reader {source_counts[SummarySource.JINA_READER]} | "
-                 f"RSS降级 {source_counts[SummarySource.RSS_FALLBACK]}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-    
-    # Content by category
-    for category in sorted(by_category.keys()):
-        articles = by_category[category]
-        lines.append(f"## {category}")
-        lines.append("")
-        
-        for summary in articles:
-            article = summary.article
-            pub_time = article.published.strftime("%Y-%m-%d %H:%M")
-            
-            lines.append(f"### [{article.title}]({article.url})")
-            lines.append(f"> 来源: {article.feed_title} | 发布时间: {pub_time}")
-            lines.append("")
-            lines.append(summary.summary)
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-    
-    # Footer
-    lines.append(f"*Generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} (SGT)*")
-    
-    return "\n".join(lines)
+        by_category[summary.meta.category].append(_render_article(summary))
+
+    out = io.StringIO()
+    _write_report(out, date_str, len(summaries), source_counts, by_category)
+    return out.getvalue()
 
 
 def save_report(
@@ -110,15 +164,24 @@ def save_report(
     dir_path.mkdir(parents=True, exist_ok=True)
     
     # Save file
-    filename = f"{date.strftime('%Y-%m-%d')}.md"
+    filename = f"{date:%Y-%m-%d}.md"
     file_path = dir_path / filename
-    
-    file_path.write_text(content, encoding="utf-8")
+
+    # Encode once and write atomically: a crash mid-write leaves the
+    # previous report intact instead of a truncated archive
+    _atomic_write_bytes(file_path, content.encode("utf-8"))
     logger.info(f"Report saved to: {file_path}")
-    
+
     return file_path
 
 
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a temp file and rename it over the target."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
 def update_readme(
     report_path: Path,
     report_content: str,
@@ -165,7 +228,7 @@ def update_readme(
     lines.append("- **LLM**: Gemini 2.0 Flash / DeepSeek V3")
     lines.append("- **Subscriptions**: See [`feeds.opml`](./feeds.opml)")
     
-    readme.write_text("\n".join(lines), encoding="utf-8")
+    _atomic_write_bytes(readme, "\n".join(lines).encode("utf-8"))
     logger.info(f"README updated: {readme}")
 
 
@@ -173,14 +236,12 @@ def generate_empty_report(date: Optional[datetime] = None) -> str:
     """Generate a report for days with no articles."""
     if date is None:
         date = datetime.now()
-    
-    date_str = date.strftime("%Y-%m-%d")
-    
-    return f"""# RSS Digest - {date_str}
+
+    return f"""# RSS Digest - {date:%Y-%m-%d}
 
 > 📭 今日无新文章收录。
 
 ---
 
-*Generated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} (SGT)*
+*Generated at {datetime.now():%Y-%m-%d %H:%M:%S} (SGT)*
 """
@@ -2,21 +2,137 @@
 Summarizer - Coordinate content fetching and LLM summarization.
 Implements fallback strategies: LLM Direct -> Jina Reader -> RSS Summary
 """
+import asyncio
+import hashlib
 import logging
+import random
 import time
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
-from typing import Optional
+from itertools import groupby
+from pathlib import Path
+from typing import NamedTuple, Optional
 
 import httpx
 
 from .config import get_config
 from .feed_fetcher import Article
 from .llm_client import LLMClient
+from .rate_limiter import DualRateLimiter
+from .summary_cache import CACHE_FILENAME as SUMMARY_CACHE_FILENAME, SummaryCache
+from .tls import shared_ssl_context
 
 logger = logging.getLogger(__name__)
 
 
+# Jina Reader client settings: every request targets r.jina.ai, so a
+# shared pooled client amortizes TCP/TLS setup across all articles
+JINA_TIMEOUT = 30.0
+_JINA_HEADERS = {"Accept": "text/markdown"}
+_JINA_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+_jina_async_client: Optional[httpx.AsyncClient] = None
+_jina_async_loop: Optional[asyncio.AbstractEventLoop] = None
+_jina_sync_client: Optional[httpx.Client] = None
+
+
+def _new_jina_client(client_cls):
+    """Build a pooled Jina client, with HTTP/2 when h2 is installed."""
+    kwargs = dict(
+        timeout=JINA_TIMEOUT,
+        limits=_JINA_LIMITS,
+        headers=_JINA_HEADERS,
+        verify=shared_ssl_context(),
+    )
+    try:
+        return client_cls(http2=True, **kwargs)
+    except ImportError:
+        return client_cls(**kwargs)
+
+
+def _get_jina_async_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient for the current event loop."""
+    global _jina_async_client, _jina_async_loop
+    loop = asyncio.get_running_loop()
+    if (
+        _jina_async_client is None
+        or _jina_async_client.is_closed
+        or _jina_async_loop is not loop
+    ):
+        _jina_async_client = _new_jina_client(httpx.AsyncClient)
+        _jina_async_loop = loop
+    return _jina_async_client
+
+
+def _get_jina_sync_client() -> httpx.Client:
+    """Get the shared blocking client for sync callers."""
+    global _jina_sync_client
+    if _jina_sync_client is None or _jina_sync_client.is_closed:
+        _jina_sync_client = _new_jina_client(httpx.Client)
+    return _jina_sync_client
+
+
+async def aclose_jina_client() -> None:
+    """Close the shared async Jina client (call at loop shutdown)."""
+    global _jina_async_client
+    if _jina_async_client is not None and not _jina_async_client.is_closed:
+        await _jina_async_client.aclose()
+    _jina_async_client = None
+
+
+# Retry policy for transient upstream failures (429 / 5xx / transport
+# errors). A brief jittered backoff recovers API stalls without falling
+# through to lower-quality strategies; anything else (auth, 4xx,
+# content policy) raises immediately so the fallback chain proceeds.
+MAX_ATTEMPTS = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+
+
+def _is_retryable_error(exc: Exception) -> bool:
+    """Whether an upstream error is worth retrying."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    # LLM SDK exceptions (openai, google) expose a status/code attribute
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Jittered exponential delay for the given (0-based) attempt."""
+    return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) + random.random()
+
+
+async def _retry_async(make_call, attempts: int = MAX_ATTEMPTS):
+    """Run an async call, retrying retryable errors with backoff."""
+    for attempt in range(attempts):
+        try:
+            return await make_call()
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_retryable_error(e):
+                raise
+            delay = _backoff_delay(attempt)
+            logger.warning(f"  Transient error ({e}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+def _retry_sync(make_call, attempts: int = MAX_ATTEMPTS):
+    """Run a blocking call, retrying retryable errors with backoff."""
+    for attempt in range(attempts):
+        try:
+            return make_call()
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_retryable_error(e):
+                raise
+            delay = _backoff_delay(attempt)
+            logger.warning(f"  Transient error ({e}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
 class SummarySource(Enum):
     """Source of the summary content."""
     LLM_DIRECT = "llm_direct"      # LLM read URL directly
@@ -24,15 +140,40 @@ class SummarySource(Enum):
     RSS_FALLBACK = "rss_fallback"  # RSS native summary
 
 
-@dataclass
+class ArticleMeta(NamedTuple):
+    """
+    The article fields the report and sync stages actually need.
+
+    Summaries carry this slim record instead of the full Article so the
+    fetched RSS content can be garbage-collected as soon as
+    summarization finishes, instead of staying pinned for the whole run.
+    """
+    title: str
+    url: str
+    category: str
+    published: datetime
+    feed_title: str
+
+    @classmethod
+    def from_article(cls, article: Article) -> "ArticleMeta":
+        return cls(
+            title=article.title,
+            url=article.url,
+            category=article.category,
+            published=article.published,
+            feed_title=article.feed_title,
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class ArticleSummary:
-    """Article with its AI-generated summary."""
-    article: Article
+    """Article metadata with its AI-generated summary."""
+    meta: ArticleMeta
     summary: str
     source: SummarySource
-    
+
     def __repr__(self) -> str:
-        return f"ArticleSummary({self.article.title!r}, source={self.source.value})"
+        return f"ArticleSummary({self.meta.title!r}, source={self.source.value})"
 
 
 async def fetch_content_jina(url: str, timeout: float = 30.0) -> Optional[str]:
@@ -47,16 +188,15 @@ async def fetch_content_jina(url: str, timeout: float = 30.0) -> Optional[str]:
         Article content as markdown, or None if failed
     """
     jina_url = f"https://r.jina.ai/{url}"
-    
+
+    async def _once() -> str:
+        client = _get_jina_async_client()
+        response = await client.get(jina_url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                jina_url,
-                timeout=timeout,
-                headers={"Accept": "text/markdown"},
-            )
-            response.raise_for_status()
-            return response.text
+        return await _retry_async(_once)
     except Exception as e:
         logger.warning(f"Jina Reader failed for {url}: {e}")
         return None
@@ -65,16 +205,15 @@ async def fetch_content_jina(url: str, timeout: float = 30.0) -> Optional[str]:
 def fetch_content_jina_sync(url: str, timeout: float = 30.0) -> Optional[str]:
     """Synchronous version of fetch_content_jina."""
     jina_url = f"https://r.jina.ai/{url}"
-    
+
+    def _once() -> str:
+        client = _get_jina_sync_client()
+        response = client.get(jina_url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+
     try:
-        with httpx.Client() as client:
-            response = client.get(
-                jina_url,
-                timeout=timeout,
-                headers={"Accept": "text/markdown"},
-            )
-            response.raise_for_status()
-            return response.text
+        return _retry_sync(_once)
     except Exception as e:
         logger.warning(f"Jina Reader failed for {url}: {e}")
         return None
@@ -104,23 +243,30 @@ def summarize_article(
     config = get_config()
     if delay_seconds is None:
         delay_seconds = config.api_delay_seconds
-    
+
     logger.info(f"Summarizing: {article.title}")
-    
+
+    # Cached from a previous run?
+    cached = _cached_summary(article)
+    if cached is not None:
+        return cached
+
     # Strategy 1: LLM direct URL reading
     try:
-        summary = llm.summarize_from_url(article.url, article.category)
+        summary = _retry_sync(
+            lambda: llm.summarize_from_url(article.url, article.category)
+        )
         if summary:
             logger.info(f"  ✓ LLM direct read successful")
             time.sleep(delay_seconds)
-            return ArticleSummary(
-                article=article,
+            return _store_summary(article, ArticleSummary(
+                meta=ArticleMeta.from_article(article),
                 summary=summary,
                 source=SummarySource.LLM_DIRECT,
-            )
+            ))
     except Exception as e:
         logger.warning(f"  ✗ LLM direct read failed: {e}")
-    
+
     # Strategy 2: Jina Reader + LLM
     try:
         content = fetch_content_jina_sync(article.url)
@@ -128,56 +274,532 @@ def summarize_article(
             summary = llm.summarize(article.url, content, article.category)
             logger.info(f"  ✓ Jina Reader + LLM successful")
             time.sleep(delay_seconds)
-            return ArticleSummary(
-                article=article,
+            return _store_summary(article, ArticleSummary(
+                meta=ArticleMeta.from_article(article),
                 summary=summary,
                 source=SummarySource.JINA_READER,
-            )
+            ))
     except Exception as e:
         logger.warning(f"  ✗ Jina Reader + LLM failed: {e}")
-    
+
     # Strategy 3: RSS summary fallback
     try:
         if article.summary:
             summary = llm.summarize(article.url, article.summary, article.category)
             logger.info(f"  ⚠ Using RSS summary fallback")
             time.sleep(delay_seconds)
-            return ArticleSummary(
-                article=article,
+            return _store_summary(article, ArticleSummary(
+                meta=ArticleMeta.from_article(article),
                 summary=summary,
                 source=SummarySource.RSS_FALLBACK,
-            )
+            ))
     except Exception as e:
         logger.error(f"  ✗ RSS fallback failed: {e}")
     
     # Final fallback: just use RSS summary as-is
     logger.warning(f"  ⚠ All strategies failed, using raw RSS summary")
+    return _raw_rss_fallback(article)
+
+
+def _raw_rss_fallback(article: Article) -> ArticleSummary:
+    """Last-resort summary built from the raw RSS text, no LLM involved."""
     return ArticleSummary(
-        article=article,
+        meta=ArticleMeta.from_article(article),
         summary=f"**核心观点**: {article.summary[:200] or '无法获取摘要'}\n\n**关键要点**:\n- 原文需要人工查看",
         source=SummarySource.RSS_FALLBACK,
     )
 
 
+_summary_cache: Optional[SummaryCache] = None
+
+
+def _get_summary_cache() -> Optional[SummaryCache]:
+    """Get the shared summary cache, or None when disabled."""
+    global _summary_cache
+    config = get_config()
+    if not config.summary_cache_enabled:
+        return None
+    if _summary_cache is None:
+        _summary_cache = SummaryCache(Path(config.archives_dir) / SUMMARY_CACHE_FILENAME)
+    return _summary_cache
+
+
+def _summary_cache_key(article: Article) -> str:
+    """Hash an article's identity and content prefix into a cache key."""
+    raw = f"{article.url}|{article.summary[:512]}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _cached_summary(article: Article) -> Optional[ArticleSummary]:
+    """Return a cached ArticleSummary for this article, if any."""
+    cache = _get_summary_cache()
+    if cache is None:
+        return None
+    entry = cache.get(_summary_cache_key(article))
+    if entry is None:
+        return None
+    logger.info(f"  ✓ Summary cache hit: {article.title}")
+    try:
+        source = SummarySource(entry["source"])
+    except (KeyError, ValueError):
+        source = SummarySource.RSS_FALLBACK
+    return ArticleSummary(
+        meta=ArticleMeta.from_article(article),
+        summary=entry["summary"],
+        source=source,
+    )
+
+
+def _store_summary(article: Article, result: ArticleSummary) -> ArticleSummary:
+    """Record a freshly generated summary in the cache."""
+    cache = _get_summary_cache()
+    if cache is not None:
+        cache.put(_summary_cache_key(article), result.summary, result.source.value)
+    return result
+
+
+def _save_summary_cache() -> None:
+    """Flush the summary cache to disk if it was used."""
+    if _summary_cache is not None:
+        _summary_cache.save()
+
+
+async def _first_successful(*coros):
+    """
+    Race coroutines and return the first non-None result.
+
+    Losing tasks are cancelled as soon as a winner completes; failed
+    tasks are logged and skipped. Returns None if every strategy fails
+    or yields nothing.
+    """
+    tasks = [asyncio.create_task(coro) for coro in coros]
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    result = task.result()
+                except Exception as e:
+                    logger.warning(f"  ✗ Speculative strategy failed: {e}")
+                    continue
+                if result is not None:
+                    return result
+        return None
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def asummarize_article(
+    article: Article,
+    llm: LLMClient,
+    limiter: Optional[DualRateLimiter] = None,
+) -> ArticleSummary:
+    """
+    Async variant of summarize_article with the same fallback chain.
+
+    Jina content is fetched on the event loop; LLM SDK calls (sync) run
+    on worker threads. Pacing comes from the shared RPM/TPM token-bucket
+    limiter, charged with the estimated prompt size before each LLM
+    call, instead of sleeping a fixed delay after it.
+
+    When config.speculative_summary is set, strategies 1 and 2 race
+    concurrently and the first success wins — saving a full LLM timeout
+    when strategy 1 stalls, at the cost of an extra API call when it
+    would have succeeded anyway.
+
+    Args:
+        article: Article to summarize
+        llm: LLM client instance
+        limiter: Shared rate limiter for LLM calls (optional)
+
+    Returns:
+        ArticleSummary with the generated summary
+    """
+    logger.info(f"Summarizing: {article.title}")
+
+    # Cached from a previous run?
+    cached = _cached_summary(article)
+    if cached is not None:
+        return cached
+
+    async def _llm_direct() -> Optional[ArticleSummary]:
+        # Strategy 1: LLM direct URL reading
+        if limiter:
+            await limiter.acquire()
+        summary = await _retry_async(
+            lambda: asyncio.to_thread(llm.summarize_from_url, article.url, article.category)
+        )
+        if not summary:
+            return None
+        logger.info(f"  ✓ LLM direct read successful")
+        return ArticleSummary(
+            meta=ArticleMeta.from_article(article),
+            summary=summary,
+            source=SummarySource.LLM_DIRECT,
+        )
+
+    async def _jina_then_llm() -> Optional[ArticleSummary]:
+        # Strategy 2: Jina Reader + LLM
+        content = await fetch_content_jina(article.url)
+        if not content:
+            return None
+        if limiter:
+            await limiter.acquire(_estimate_tokens(content))
+        summary = await asyncio.to_thread(llm.summarize, article.url, content, article.category)
+        logger.info(f"  ✓ Jina Reader + LLM successful")
+        return ArticleSummary(
+            meta=ArticleMeta.from_article(article),
+            summary=summary,
+            source=SummarySource.JINA_READER,
+        )
+
+    if get_config().speculative_summary:
+        result = await _first_successful(_llm_direct(), _jina_then_llm())
+        if result is not None:
+            return _store_summary(article, result)
+    else:
+        try:
+            result = await _llm_direct()
+            if result is not None:
+                return _store_summary(article, result)
+        except Exception as e:
+            logger.warning(f"  ✗ LLM direct read failed: {e}")
+
+        try:
+            result = await _jina_then_llm()
+            if result is not None:
+                return _store_summary(article, result)
+        except Exception as e:
+            logger.warning(f"  ✗ Jina Reader + LLM failed: {e}")
+
+    # Strategy 3: RSS summary fallback
+    try:
+        if article.summary:
+            if limiter:
+                await limiter.acquire(_estimate_tokens(article.summary))
+            summary = await asyncio.to_thread(llm.summarize, article.url, article.summary, article.category)
+            logger.info(f"  ⚠ Using RSS summary fallback")
+            return _store_summary(article, ArticleSummary(
+                meta=ArticleMeta.from_article(article),
+                summary=summary,
+                source=SummarySource.RSS_FALLBACK,
+            ))
+    except Exception as e:
+        logger.error(f"  ✗ RSS fallback failed: {e}")
+
+    # Final fallback: just use RSS summary as-is
+    logger.warning(f"  ⚠ All strategies failed, using raw RSS summary")
+    return _raw_rss_fallback(article)
+
+
+async def summarize_articles_pipelined(
+    articles: list[Article],
+    llm: LLMClient,
+    fetch_concurrency: Optional[int] = None,
+    llm_concurrency: Optional[int] = None,
+) -> list[ArticleSummary]:
+    """
+    Summarize articles through a fetch → LLM producer–consumer pipeline.
+
+    Content fetching and LLM summarization are the two dominant
+    latencies; separate worker pools joined by a bounded queue let the
+    fetch stage run ahead so the LLM stage always has prefetched content
+    waiting instead of idling while its own article downloads. Worker
+    counts are sized independently per service rate budget.
+
+    The LLM-direct strategy is skipped here — there is nothing to
+    prefetch for it; use summarize_articles_async when the provider can
+    read URLs itself.
+
+    Args:
+        articles: List of articles to summarize
+        llm: LLM client instance
+        fetch_concurrency: Jina fetch workers (default: from config)
+        llm_concurrency: LLM workers (default: from config)
+
+    Returns:
+        List of ArticleSummary objects, in completion order
+    """
+    config = get_config()
+    if fetch_concurrency is None:
+        fetch_concurrency = config.fetch_concurrency
+    if llm_concurrency is None:
+        llm_concurrency = config.llm_concurrency
+
+    pending: asyncio.Queue = asyncio.Queue()
+    for article in articles:
+        pending.put_nowait(article)
+
+    # Bounded so fetchers cannot pin every article's content at once
+    fetched: asyncio.Queue = asyncio.Queue(maxsize=llm_concurrency * 2)
+
+    limiter = _llm_limiter(config)
+    summaries: list[ArticleSummary] = []
+    total = len(articles)
+
+    async def _fetch_worker() -> None:
+        while True:
+            try:
+                article = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            cached = _cached_summary(article)
+            if cached is not None:
+                summaries.append(cached)
+                continue
+            content = await fetch_content_jina(article.url)
+            if content:
+                await fetched.put((article, content, SummarySource.JINA_READER))
+            else:
+                await fetched.put((article, article.summary, SummarySource.RSS_FALLBACK))
+
+    async def _llm_worker() -> None:
+        while True:
+            item = await fetched.get()
+            if item is None:
+                return
+            article, content, source = item
+            logger.info(f"Summarizing: {article.title}")
+            try:
+                if limiter:
+                    await limiter.acquire(_estimate_tokens(content))
+                text = await asyncio.to_thread(llm.summarize, article.url, content, article.category)
+                summaries.append(_store_summary(article, ArticleSummary(
+                    meta=ArticleMeta.from_article(article),
+                    summary=text,
+                    source=source,
+                )))
+            except Exception as e:
+                logger.error(f"  ✗ Summarization failed for {article.title}: {e}")
+                summaries.append(_raw_rss_fallback(article))
+            logger.info(f"  [{len(summaries)}/{total}] done")
+
+    try:
+        fetchers = [
+            asyncio.create_task(_fetch_worker())
+            for _ in range(min(fetch_concurrency, max(1, total)))
+        ]
+        consumers = [asyncio.create_task(_llm_worker()) for _ in range(llm_concurrency)]
+
+        await asyncio.gather(*fetchers)
+        for _ in consumers:
+            await fetched.put(None)
+        await asyncio.gather(*consumers)
+    finally:
+        _save_summary_cache()
+        await aclose_jina_client()
+
+    return summaries
+
+
+def summarize_articles_batched(
+    articles: list[Article],
+    llm: LLMClient,
+    batch_size: int = 4,
+) -> list[ArticleSummary]:
+    """
+    Summarize articles in multi-article LLM requests.
+
+    Articles are grouped by category, then into batches of `batch_size`,
+    and each batch is sent as one prompt via LLMClient.summarize_batch —
+    dividing the request count (and RPM pressure) by the batch factor,
+    with the category stated once per prompt instead of once per
+    article. Batches whose response cannot be split back into
+    per-article summaries fall back to the per-article path.
+
+    Args:
+        articles: List of articles to summarize
+        llm: LLM client instance
+        batch_size: Number of articles per LLM request
+
+    Returns:
+        List of ArticleSummary objects, grouped by category
+    """
+    config = get_config()
+    summaries: list[ArticleSummary] = []
+
+    # Same-category articles share one prompt so the category header is
+    # sent (and billed) once per batch
+    grouped = sorted(articles, key=lambda a: a.category)
+    batches = [
+        group[start:start + batch_size]
+        for _, members in groupby(grouped, key=lambda a: a.category)
+        for group in [list(members)]
+        for start in range(0, len(group), batch_size)
+    ]
+
+    for batch_index, batch in enumerate(batches, 1):
+        logger.info(
+            f"Summarizing batch {batch_index}/{len(batches)} "
+            f"({len(batch)} articles, category: {batch[0].category})"
+        )
+
+        # Gather content per article: Jina Reader, then RSS summary
+        items: list[tuple[str, str, str]] = []
+        sources: list[SummarySource] = []
+        for article in batch:
+            content = fetch_content_jina_sync(article.url)
+            if content:
+                sources.append(SummarySource.JINA_READER)
+            else:
+                content = article.summary
+                sources.append(SummarySource.RSS_FALLBACK)
+            items.append((article.url, content, article.category))
+
+        try:
+            texts = llm.summarize_batch(items)
+            time.sleep(config.api_delay_seconds)
+            summaries.extend(
+                ArticleSummary(
+                    meta=ArticleMeta.from_article(article),
+                    summary=text,
+                    source=source,
+                )
+                for article, text, source in zip(batch, texts, sources)
+            )
+        except Exception as e:
+            logger.warning(f"Batched summarization failed, falling back per-article: {e}")
+            summaries.extend(summarize_article(article, llm) for article in batch)
+
+    return summaries
+
+
 def summarize_articles(
     articles: list[Article],
     llm: LLMClient,
 ) -> list[ArticleSummary]:
     """
-    Summarize multiple articles.
-    
+    Summarize multiple articles sequentially.
+
     Args:
         articles: List of articles to summarize
         llm: LLM client instance
-        
+
     Returns:
         List of ArticleSummary objects
     """
     summaries: list[ArticleSummary] = []
-    
+
     for i, article in enumerate(articles, 1):
         logger.info(f"[{i}/{len(articles)}] Processing...")
         summary = summarize_article(article, llm)
         summaries.append(summary)
-    
+
+    _save_summary_cache()
     return summaries
+
+
+async def summarize_articles_async(
+    articles: list[Article],
+    llm: LLMClient,
+    concurrency: Optional[int] = None,
+) -> list[ArticleSummary]:
+    """
+    Summarize multiple articles concurrently.
+
+    Each article is an independent chain of network calls, so several
+    are processed at once; a semaphore bounds in-flight requests to stay
+    inside the provider's rate budget.
+
+    Args:
+        articles: List of articles to summarize
+        llm: LLM client instance
+        concurrency: Max articles in flight (default: from config)
+
+    Returns:
+        List of ArticleSummary objects, in input order
+    """
+    config = get_config()
+    if concurrency is None:
+        concurrency = config.llm_concurrency
+
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = _llm_limiter(config)
+    total = len(articles)
+
+    async def _bounded(index: int, article: Article) -> ArticleSummary:
+        async with semaphore:
+            logger.info(f"[{index}/{total}] Processing...")
+            return await asummarize_article(article, llm, limiter)
+
+    try:
+        return list(await asyncio.gather(
+            *(_bounded(i, article) for i, article in enumerate(articles, 1))
+        ))
+    finally:
+        _save_summary_cache()
+        await aclose_jina_client()
+
+
+async def iter_summaries(
+    articles: list[Article],
+    llm: LLMClient,
+    concurrency: Optional[int] = None,
+):
+    """
+    Yield ArticleSummary objects as each article completes.
+
+    Same bounded concurrency as summarize_articles_async, but results
+    are surfaced in completion order instead of being gathered into a
+    list, so downstream rendering and I/O overlap with the slowest LLM
+    calls. Input order is NOT preserved.
+
+    Args:
+        articles: List of articles to summarize
+        llm: LLM client instance
+        concurrency: Max articles in flight (default: from config)
+
+    Yields:
+        ArticleSummary objects, one per article, in completion order
+    """
+    config = get_config()
+    if concurrency is None:
+        concurrency = config.llm_concurrency
+
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = _llm_limiter(config)
+    total = len(articles)
+
+    async def _bounded(index: int, article: Article) -> ArticleSummary:
+        async with semaphore:
+            logger.info(f"[{index}/{total}] Processing...")
+            return await asummarize_article(article, llm, limiter)
+
+    tasks = [
+        asyncio.ensure_future(_bounded(i, article))
+        for i, article in enumerate(articles, 1)
+    ]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+        _save_summary_cache()
+        await aclose_jina_client()
+
+
+def _estimate_tokens(text: str) -> float:
+    """Rough prompt-token estimate (~4 chars per token)."""
+    return max(1.0, len(text) / 4)
+
+
+def _llm_limiter(config) -> Optional[DualRateLimiter]:
+    """
+    Build the shared LLM rate limiter from the provider budgets.
+
+    PROVIDER_RPM/PROVIDER_TPM set explicit per-minute budgets; when RPM
+    is unset it derives from api_delay_seconds (one call per delay on
+    average). Returns None when no budget applies at all.
+    """
+    rpm = float(config.provider_rpm)
+    if rpm <= 0 and config.api_delay_seconds > 0:
+        # One call per api_delay_seconds on average, expressed per minute
+        rpm = max(1.0, 60.0 / config.api_delay_seconds)
+
+    if rpm <= 0 and config.provider_tpm <= 0:
+        return None
+    return DualRateLimiter(rpm, float(config.provider_tpm))
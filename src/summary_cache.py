@@ -0,0 +1,78 @@
+"""
+Summary Cache - Persist LLM summaries across runs keyed by content hash.
+
+Re-runs (retry after partial failure, manual regeneration) see mostly
+the same articles; serving those from disk skips the whole
+Jina-fetch + LLM round-trip for every repeat.
+"""
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = ".summary_cache.json"
+
+# Entries older than this are dropped on load
+DEFAULT_TTL_SECONDS = 14 * 24 * 3600
+
+
+class SummaryCache:
+    """On-disk cache of generated summaries keyed by article hash."""
+
+    def __init__(self, path: str | Path, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the cache, loading unexpired entries if present.
+
+        Args:
+            path: Path to the cache JSON file
+            ttl_seconds: Max age for a cached summary
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Load cached summaries from disk, pruning expired entries."""
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable summary cache {self.path}: {e}")
+            return
+        if not isinstance(data, dict):
+            return
+
+        cutoff = time.time() - self.ttl_seconds
+        self._entries = {
+            key: entry
+            for key, entry in data.items()
+            if isinstance(entry, dict) and entry.get("ts", 0) >= cutoff
+        }
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached entry for a key, or None."""
+        return self._entries.get(key)
+
+    def put(self, key: str, summary: str, source: str) -> None:
+        """Store a freshly generated summary."""
+        self._entries[key] = {
+            "summary": summary,
+            "source": source,
+            "ts": time.time(),
+        }
+
+    def save(self) -> None:
+        """Persist the cache to disk."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(
+                json.dumps(self._entries, ensure_ascii=False),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            logger.warning(f"Failed to save summary cache {self.path}: {e}")
@@ -0,0 +1,19 @@
+"""
+TLS - Shared SSL context with session resumption enabled.
+
+Reusing one context across clients lets reconnects to the same hosts
+(r.jina.ai, api.deepseek.com, open.feishu.cn) resume prior TLS sessions
+via tickets instead of running a full handshake each time a pooled
+connection is replaced.
+"""
+import ssl
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def shared_ssl_context() -> ssl.SSLContext:
+    """Build (once) the default-verify context with session tickets on."""
+    ctx = ssl.create_default_context()
+    # Session tickets enable 1-RTT resumption on reconnect
+    ctx.options &= ~ssl.OP_NO_TICKET
+    return ctx